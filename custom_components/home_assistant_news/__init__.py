@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
 
 import os
 from aiohttp import web
@@ -11,14 +10,22 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
-from .const import DOMAIN
-from .coordinator import NewsCoordinator
+from .const import DEFAULT_ENABLED_CATEGORIES, DEFAULTS, DOMAIN
+from .coordinator import NewsCoordinator, feed_cache_store
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entries whose options were never saved have always fetched 2 articles per
+# category at runtime, whatever the options form suggests
+_ENTRY_DEFAULTS = {**DEFAULTS, "max_per_category": 2}
+
 PLATFORMS: list[str] = ["sensor"]
 
+# Options payloads from the panel are a few hundred bytes
+MAX_CONFIG_BODY_BYTES = 64 * 1024
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Home Assistant News integration."""
@@ -41,8 +48,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register API endpoints and static path (only once)
     if "_views_registered" not in hass.data[DOMAIN]:
         # Views are defined at the bottom of this file
-        hass.http.register_view(AINewsAnchorConfigView)
-        hass.http.register_view(AINewsAnchorRefreshView)
+        hass.http.register_view(AINewsAnchorAPIView)
         
         # Register view to serve panel HTML - MUST be registered before entry setup
         hass.http.register_view(AINewsAnchorPanelView)
@@ -52,66 +58,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Log panel registration for debugging
         _LOGGER.info("Home Assistant News panel registered at /local/home_assistant_news/panel.html")
     
+    opts = {**_ENTRY_DEFAULTS, **entry.options}
     coordinator = NewsCoordinator(
         hass,
-        scan_interval=entry.options.get("scan_interval", 1800),
-        max_per_category=entry.options.get("max_per_category", 2),
-        local_geo=entry.options.get("local_geo", "New York, NY"),
-        enabled_categories=entry.options.get(
-            "enabled_categories",
-            {
-                "U.S.": True,
-                "World": True,
-                "Local": True,
-                "Business": True,
-                "Technology": True,
-                "Entertainment": True,
-                "Sports": True,
-                "Science": True,
-                "Health": True,
-            },
-        ),
-        custom_sources=entry.options.get("custom_sources", []),
+        entry,
+        scan_interval=opts["scan_interval"],
+        max_per_category=opts["max_per_category"],
+        local_geo=opts["local_geo"],
+        enabled_categories=opts["enabled_categories"] or DEFAULT_ENABLED_CATEGORIES,
+        custom_sources=opts["custom_sources"],
     )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Fetch once before the sensors are added so they start with data;
+    # forwarding the platforms does not trigger a refresh on its own
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new coordinator; don't leak this one's pool
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        raise
+
     # Forward entry setup to sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Start initial fetch
-    await coordinator.async_config_entry_first_refresh()
-
     # Update coordinator when options change
     async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Handle options update."""
+        opts = {**_ENTRY_DEFAULTS, **entry.options}
         old_custom_sources = coordinator._custom_sources
-        coordinator._max_per_category = entry.options.get("max_per_category", 2)
-        coordinator._local_geo = entry.options.get("local_geo", "New York, NY")
-        coordinator._enabled_categories = entry.options.get(
-            "enabled_categories",
-            {
-                "U.S.": True,
-                "World": True,
-                "Local": True,
-                "Business": True,
-                "Technology": True,
-                "Entertainment": True,
-                "Sports": True,
-                "Science": True,
-                "Health": True,
-            },
-        )
-        coordinator._custom_sources = entry.options.get("custom_sources", [])
-        coordinator.update_interval = timedelta(
-            seconds=entry.options.get("scan_interval", 1800)
+        coordinator.update_options(
+            scan_interval=opts["scan_interval"],
+            max_per_category=opts["max_per_category"],
+            local_geo=opts["local_geo"],
+            enabled_categories=opts["enabled_categories"] or DEFAULT_ENABLED_CATEGORIES,
+            custom_sources=opts["custom_sources"],
         )
         
         # If custom sources changed, reload the entry to recreate sensors
         if old_custom_sources != coordinator._custom_sources:
             await hass.config_entries.async_reload(entry.entry_id)
         else:
-            await coordinator.async_request_refresh()
+            entry.async_create_background_task(
+                hass, coordinator.async_request_refresh(), name="news-refresh"
+            )
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
@@ -122,18 +114,42 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: NewsCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
     return unload_ok
 
 
-class AINewsAnchorConfigView(HomeAssistantView):
-    """View to handle config API requests."""
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's stored news snapshot."""
+    await feed_cache_store(hass, entry.entry_id).async_remove()
+
+
+class AINewsAnchorAPIView(HomeAssistantView):
+    """View to handle config and refresh API requests.
+
+    All actions share one route so the panel's calls go through a single
+    router entry and auth check.
+    """
 
-    url = "/api/home_assistant_news/config"
-    name = "api:home_assistant_news:config"
+    url = "/api/home_assistant_news/{action}"
+    name = "api:home_assistant_news"
     requires_auth = True
 
-    async def get(self, request: web.Request) -> web.Response:
+    async def get(self, request: web.Request, action: str) -> web.Response:
+        """Dispatch a GET request to its action handler."""
+        if action == "config":
+            return await self._get_config(request)
+        return self.json({"error": f"Unknown action: {action}"}, status_code=404)
+
+    async def post(self, request: web.Request, action: str) -> web.Response:
+        """Dispatch a POST request to its action handler."""
+        if action == "config":
+            return await self._post_config(request)
+        if action == "refresh":
+            return await self._post_refresh(request)
+        return self.json({"error": f"Unknown action: {action}"}, status_code=404)
+
+    async def _get_config(self, request: web.Request) -> web.Response:
         """Get current configuration."""
         hass: HomeAssistant = request.app["hass"]
         entries = hass.config_entries.async_entries(DOMAIN)
@@ -141,32 +157,20 @@ class AINewsAnchorConfigView(HomeAssistantView):
             return self.json({"error": "No config entry found"}, status_code=404)
 
         entry = entries[0]
+        opts = {**_ENTRY_DEFAULTS, **entry.options}
         config = {
             "entry_id": entry.entry_id,
-            "local_geo": entry.options.get("local_geo", "New York, NY"),
-            "max_per_category": entry.options.get("max_per_category", 2),
-            "scan_interval": entry.options.get("scan_interval", 1800),
-            "ai_mode": entry.options.get("ai_mode", "auto"),
-            "conversation_agent_id": entry.options.get("conversation_agent_id", ""),
-            "enabled_categories": entry.options.get(
-                "enabled_categories",
-                {
-                    "U.S.": True,
-                    "World": True,
-                    "Local": True,
-                    "Business": True,
-                    "Technology": True,
-                    "Entertainment": True,
-                    "Sports": True,
-                    "Science": True,
-                    "Health": True,
-                },
-            ),
-            "custom_sources": entry.options.get("custom_sources", []),
+            "local_geo": opts["local_geo"],
+            "max_per_category": opts["max_per_category"],
+            "scan_interval": opts["scan_interval"],
+            "ai_mode": opts["ai_mode"],
+            "conversation_agent_id": opts["conversation_agent_id"],
+            "enabled_categories": dict(opts["enabled_categories"]),
+            "custom_sources": opts["custom_sources"],
         }
         return self.json(config)
 
-    async def post(self, request: web.Request) -> web.Response:
+    async def _post_config(self, request: web.Request) -> web.Response:
         """Update configuration."""
         hass: HomeAssistant = request.app["hass"]
         entries = hass.config_entries.async_entries(DOMAIN)
@@ -174,57 +178,37 @@ class AINewsAnchorConfigView(HomeAssistantView):
             return self.json({"error": "No config entry found"}, status_code=404)
 
         entry = entries[0]
-        data = await request.json()
+        if (request.content_length or 0) > MAX_CONFIG_BODY_BYTES:
+            return self.json({"error": "Payload too large"}, status_code=413)
+
+        # Content-Length may be missing (chunked), so stop reading as soon as
+        # the body passes the limit rather than buffering all of it
+        body = bytearray()
+        async for chunk in request.content.iter_chunked(16 * 1024):
+            body += chunk
+            if len(body) > MAX_CONFIG_BODY_BYTES:
+                return self.json({"error": "Payload too large"}, status_code=413)
+        try:
+            data = json_loads(body)
+        except JSON_DECODE_EXCEPTIONS as err:
+            return self.json({"error": f"Invalid JSON: {err}"}, status_code=400)
 
         try:
-            # Ensure enabled_categories is properly formatted
-            if "enabled_categories" not in data or not isinstance(data["enabled_categories"], dict):
-                # If not provided, use defaults
-                data["enabled_categories"] = entry.options.get(
-                    "enabled_categories",
-                    {
-                        "U.S.": True,
-                        "World": True,
-                        "Local": True,
-                        "Business": True,
-                        "Technology": True,
-                        "Entertainment": True,
-                        "Sports": True,
-                        "Science": True,
-                        "Health": True,
-                    },
-                )
-            
-            # Update options
-            hass.config_entries.async_update_entry(entry, options=data)
-            
-            # Trigger coordinator update
-            if entry.entry_id in hass.data[DOMAIN]:
-                coordinator = hass.data[DOMAIN][entry.entry_id]
-                coordinator._local_geo = data.get("local_geo", coordinator._local_geo)
-                coordinator._max_per_category = data.get("max_per_category", coordinator._max_per_category)
-                coordinator._enabled_categories = data.get("enabled_categories", coordinator._enabled_categories)
-                coordinator._custom_sources = data.get("custom_sources", [])
-                coordinator.update_interval = timedelta(
-                    seconds=data.get("scan_interval", entry.options.get("scan_interval", 1800))
-                )
-            
+            # Merge onto the stored options so unchanged keys are kept as-is;
+            # async_update_entry skips the store write when nothing changed
+            options = {**entry.options, **data}
+            if not isinstance(options.get("enabled_categories"), dict):
+                options["enabled_categories"] = dict(DEFAULT_ENABLED_CATEGORIES)
+
+            # The entry's update listener pushes the new options to the coordinator
+            hass.config_entries.async_update_entry(entry, options=options)
+
             return self.json({"success": True})
         except Exception as err:
             _LOGGER.exception("Error updating config: %s", err)
             return self.json({"error": str(err)}, status_code=400)
 
-
-
-
-class AINewsAnchorRefreshView(HomeAssistantView):
-    """View to manually refresh news data."""
-
-    url = "/api/home_assistant_news/refresh"
-    name = "api:home_assistant_news:refresh"
-    requires_auth = True
-
-    async def post(self, request: web.Request) -> web.Response:
+    async def _post_refresh(self, request: web.Request) -> web.Response:
         """Trigger a manual refresh of news data."""
         hass: HomeAssistant = request.app["hass"]
         entries = hass.config_entries.async_entries(DOMAIN)
@@ -232,17 +216,17 @@ class AINewsAnchorRefreshView(HomeAssistantView):
             return self.json({"error": "No config entry found"}, status_code=404)
 
         entry = entries[0]
-        
-        try:
-            if entry.entry_id in hass.data[DOMAIN]:
-                coordinator = hass.data[DOMAIN][entry.entry_id]
-                await coordinator.async_request_refresh()
-                return self.json({"success": True, "message": "Refresh triggered"})
-            else:
-                return self.json({"error": "Coordinator not found"}, status_code=404)
-        except Exception as err:
-            _LOGGER.exception("Error refreshing data: %s", err)
-            return self.json({"error": str(err)}, status_code=500)
+        if (coordinator := hass.data[DOMAIN].get(entry.entry_id)) is None:
+            return self.json({"error": "Coordinator not found"}, status_code=404)
+
+        # Don't hold the request open for the whole fetch; the coordinator's
+        # debouncer folds rapid repeat requests into a single refresh
+        entry.async_create_background_task(
+            hass, coordinator.async_request_refresh(), name="news-manual-refresh"
+        )
+        return self.json(
+            {"success": True, "message": "Refresh scheduled"}, status_code=202
+        )
 
 
 class AINewsAnchorPanelView(HomeAssistantView):
@@ -11,10 +11,22 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 
-from .const import CATEGORY_MAP, DEFAULTS, DOMAIN
+from .const import CATEGORY_ORDER, DEFAULTS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Flattened options-form field for each category, in display order
+# ("U.S." becomes "category_u_s")
+_CATEGORY_KEYS: tuple[tuple[str, str], ...] = tuple(
+    (f"category_{category.lower().replace('.', '_').replace(' ', '_').strip('_')}", category)
+    for category in CATEGORY_ORDER
+)
+
+# Validators don't depend on the current options, so build them once
+_MAX_PER_CATEGORY_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=10))
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=600, max=7200))
+_AI_MODE_VALIDATOR = vol.In(["auto", "google_generative_ai_conversation", "conversation"])
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Home Assistant News."""
@@ -54,15 +66,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             # Convert flattened category fields back to nested dict
             enabled_categories_dict = {
-                "U.S.": user_input.pop("category_u_s", True),
-                "World": user_input.pop("category_world", True),
-                "Local": user_input.pop("category_local", True),
-                "Business": user_input.pop("category_business", True),
-                "Technology": user_input.pop("category_technology", True),
-                "Entertainment": user_input.pop("category_entertainment", True),
-                "Sports": user_input.pop("category_sports", True),
-                "Science": user_input.pop("category_science", True),
-                "Health": user_input.pop("category_health", True),
+                category: user_input.pop(key, True) for key, category in _CATEGORY_KEYS
             }
             user_input["enabled_categories"] = enabled_categories_dict
             
@@ -88,56 +92,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(
                     "max_per_category",
                     default=options.get("max_per_category", DEFAULTS["max_per_category"]),
-                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                ): _MAX_PER_CATEGORY_VALIDATOR,
                 vol.Required(
                     "scan_interval",
                     default=options.get("scan_interval", DEFAULTS["scan_interval"]),
-                ): vol.All(vol.Coerce(int), vol.Range(min=600, max=7200)),
+                ): _SCAN_INTERVAL_VALIDATOR,
                 vol.Required(
                     "ai_mode",
                     default=options.get("ai_mode", DEFAULTS["ai_mode"]),
-                ): vol.In(["auto", "google_generative_ai_conversation", "conversation"]),
+                ): _AI_MODE_VALIDATOR,
                 vol.Optional(
                     "conversation_agent_id",
                     default=options.get("conversation_agent_id", DEFAULTS["conversation_agent_id"]),
                 ): str,
                 # Flatten enabled_categories to avoid nested schema serialization issues
-                vol.Optional(
-                    "category_u_s",
-                    default=enabled_categories.get("U.S.", True),
-                ): bool,
-                vol.Optional(
-                    "category_world",
-                    default=enabled_categories.get("World", True),
-                ): bool,
-                vol.Optional(
-                    "category_local",
-                    default=enabled_categories.get("Local", True),
-                ): bool,
-                vol.Optional(
-                    "category_business",
-                    default=enabled_categories.get("Business", True),
-                ): bool,
-                vol.Optional(
-                    "category_technology",
-                    default=enabled_categories.get("Technology", True),
-                ): bool,
-                vol.Optional(
-                    "category_entertainment",
-                    default=enabled_categories.get("Entertainment", True),
-                ): bool,
-                vol.Optional(
-                    "category_sports",
-                    default=enabled_categories.get("Sports", True),
-                ): bool,
-                vol.Optional(
-                    "category_science",
-                    default=enabled_categories.get("Science", True),
-                ): bool,
-                vol.Optional(
-                    "category_health",
-                    default=enabled_categories.get("Health", True),
-                ): bool,
+                **{
+                    vol.Optional(key, default=enabled_categories.get(category, True)): bool
+                    for key, category in _CATEGORY_KEYS
+                },
             }
         )
 
@@ -1,4 +1,5 @@
 """Constants for Home Assistant News integration."""
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "home_assistant_news"
@@ -15,6 +16,12 @@ CATEGORY_MAP: Final[dict[str, str]] = {
     "Health": "HEALTH",
 }
 
+# Categories in display/briefing order
+CATEGORY_ORDER: Final[tuple[str, ...]] = tuple(CATEGORY_MAP)
+
+# Read-only so the shared default can't be mutated through an options dict
+DEFAULT_ENABLED_CATEGORIES: Final = MappingProxyType(dict.fromkeys(CATEGORY_ORDER, True))
+
 GOOGLE_RSS_BASE: Final = "https://news.google.com/rss/headlines/section"
 GOOGLE_RSS_SEARCH_BASE: Final = "https://news.google.com/rss/search"
 
@@ -24,17 +31,7 @@ DEFAULTS = {
     "local_geo": "New York, NY",
     "ai_mode": "auto",
     "conversation_agent_id": "",
-    "enabled_categories": {
-        "U.S.": True,
-        "World": True,
-        "Local": True,
-        "Business": True,
-        "Technology": True,
-        "Entertainment": True,
-        "Sports": True,
-        "Science": True,
-        "Health": True,
-    },
+    "enabled_categories": DEFAULT_ENABLED_CATEGORIES,
     "custom_sources": [],
 }
 
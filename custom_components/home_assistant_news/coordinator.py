@@ -5,17 +5,305 @@ import asyncio
 import html
 import logging
 import re
-import xml.etree.ElementTree as ET
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import timedelta
-from urllib.parse import quote
+from functools import partial
+from hashlib import blake2b
+from io import BytesIO
+from typing import Any, TypeVar
+from urllib.parse import quote, urlsplit
 
-from homeassistant.core import HomeAssistant
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientResponse,
+    ClientTimeout,
+    ClientSession,
+    TCPConnector,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util, ssl as ssl_util
+from lxml import etree, html as lxml_html
+
+try:
+    from readability import Document
+except ImportError:
+    # Checked once here rather than per article; basic extraction takes over
+    _HAS_READABILITY = False
+else:
+    _HAS_READABILITY = True
 
 from .const import CATEGORY_MAP, DEFAULTS, DOMAIN, GOOGLE_RSS_BASE, GOOGLE_RSS_SEARCH_BASE
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+STORAGE_VERSION = 1
+# A stored snapshot only bridges startup; fetch fresh news this soon after
+_SEED_REFRESH_DELAY = 60
+
+# Concurrent feed fetches and article scrapes per update.
+# Google rate-limits bursts; nine categories plus custom sources otherwise go out at once
+_FEED_CONCURRENCY = 4
+# Articles are spread over many publishers, but a refresh can still queue
+# dozens of page loads; cap sockets and TLS handshakes in flight
+_SCRAPE_CONCURRENCY = 8
+# Stories stay in Google's feeds for many scans; keep their extracted text.
+# Failures are remembered for less time so a flaky site gets another chance
+_SCRAPE_CACHE_SIZE = 512
+_SCRAPE_CACHE_TTL = 6 * 3600
+_SCRAPE_CACHE_NEGATIVE_TTL = 30 * 60
+# Most recent scrape cache entries kept across restarts
+_PERSISTED_SCRAPES = 200
+# The snapshot is large; coalesce the writes of back-to-back updates
+_SAVE_DELAY = 300
+# Article text is near the top of the page; the rest is mostly trackers and
+# inline scripts that extraction throws away
+_MAX_ARTICLE_BYTES = 512 * 1024
+# Pages declaring more than this are archives or media served as HTML
+_MAX_ARTICLE_CONTENT_LENGTH = 2_000_000
+# Summaries are kept for every article between updates; cap their length
+_MAX_SUMMARY_CHARS = 5000
+# One slow publisher must not hold up the whole refresh; past the deadline
+# the article falls back to its RSS description
+_SCRAPE_DEADLINE = 20
+_REDIRECT_TIMEOUT = ClientTimeout(total=15, sock_connect=5)
+# Session defaults, used as-is for article pages
+_ARTICLE_TIMEOUT = ClientTimeout(total=20, sock_connect=5, sock_read=15)
+_SCRAPE_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Upgrade-Insecure-Requests": "1",
+    "Referer": "https://news.google.com/",
+}
+# RSS compresses well; aiohttp decodes gzip/deflate transparently. These
+# override the browser-like session defaults meant for article pages
+_FEED_HEADERS: dict[str, str] = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "HomeAssistantNews/1.0",
+}
+
+# Items parsed beyond max_per_category, since cross-category de-duplication
+# drops some of them; a feed that still comes up short is parsed in full
+_PARSE_HEADROOM = 15
+
+# Network failures worth one immediate retry (unlike HTTP errors or bad XML)
+_TRANSIENT_ERRORS = (asyncio.TimeoutError, ClientConnectionError)
+
+# Articles whose SimHash fingerprints differ in at most this many of 64 bits
+# are treated as the same story syndicated under another URL
+_SIMHASH_DISTANCE = 6
+_SIMHASH_BANDS = 4
+
+# Trailing source attribution on titles: " - Source", " | Source", " – Source"
+_TITLE_SOURCE_RE = re.compile(r"\s*[-|–—]\s*[^-|–—]+$")
+
+# Links that resolve to these never yield article text worth the request
+_SKIP_HOSTS = frozenset(
+    {
+        "youtube.com",
+        "youtu.be",
+        "twitter.com",
+        "x.com",
+        "facebook.com",
+        "instagram.com",
+        "tiktok.com",
+    }
+)
+_SKIP_SUFFIXES = (".pdf", ".mp4", ".mp3")
+
+# Google News interstitial pages: ways the real article URL is exposed
+# One pass finds all of them; _find_redirect_target applies the priority
+_REDIRECT_TARGET_RE = re.compile(
+    r'<meta[^>]*http-equiv=["\']?refresh["\']?[^>]*content=["\']?[^"\']*url=(?P<meta>[^"\']+)'
+    r'|window\.location\.href\s*=\s*["\'](?P<js>[^"\']+)["\']'
+    r'|<a[^>]*href=["\'](?P<href>[^"\']+)["\'][^>]*>(?P<text>[^<]*)',
+    re.IGNORECASE,
+)
+
+# Fallback HTML extraction: page chrome to drop, then likely article containers
+_NON_CONTENT_TAGS = (
+    "script", "style", "noscript", "nav", "header", "footer", "aside", "form", "button",
+)
+_QUICK_ARTICLE_XPATH = etree.XPath("//article | //main")
+_QUICK_ARTICLE_MIN_CHARS = 1000
+_ARTICLE_XPATH = etree.XPath(
+    "//article | //main"
+    " | //div[contains(@class, 'article') or contains(@class, 'content')"
+    " or contains(@class, 'post') or contains(@class, 'entry')"
+    " or contains(@id, 'content') or contains(@id, 'article')]"
+    " | //section[contains(@class, 'content')]"
+)
+
+
+async def _settle(awaitable: Awaitable[_T]) -> _T | Exception:
+    """Return what awaitable returns, or the exception it raises.
+
+    Keeps one failed feed from cancelling a whole TaskGroup.
+    """
+    try:
+        return await awaitable
+    except Exception as err:
+        return err
+
+
+def _find_redirect_target(page: str) -> str | None:
+    """Return the article URL from a Google News interstitial page.
+
+    In order of preference: meta refresh, JavaScript redirect, a "Read more"
+    link, then the first link off Google.
+    """
+    js = read_more = external = None
+    for match in _REDIRECT_TARGET_RE.finditer(page):
+        if meta := match["meta"]:
+            return meta
+        if match["js"]:
+            js = js or match["js"]
+        elif href := match["href"]:
+            if read_more is None and "read more" in match["text"].lower():
+                read_more = href
+            if (
+                external is None
+                and href.startswith(("http://", "https://"))
+                and "google.com" not in href
+            ):
+                external = href
+    return js or read_more or external
+
+
+def _is_unscrapable(url: str) -> bool:
+    """Return True for social/video hosts and media files."""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").removeprefix("www.").removeprefix("m.")
+    return host in _SKIP_HOSTS or parts.path.lower().endswith(_SKIP_SUFFIXES)
+
+
+def _is_article_response(response: ClientResponse) -> bool:
+    """Return True unless the headers declare non-HTML or an oversized body.
+
+    Checked before reading the body, so PDFs and media are never downloaded.
+    """
+    if (response.content_length or 0) > _MAX_ARTICLE_CONTENT_LENGTH:
+        return False
+    if "Content-Type" not in response.headers:
+        return True
+    return response.content_type in ("text/html", "application/xhtml+xml")
+
+
+def _page_encoding(response: ClientResponse, page: bytes) -> str | None:
+    """Return the charset to decode page with, or None to use its own declaration.
+
+    The HTTP header wins; pages declaring nothing anywhere are assumed UTF-8.
+    """
+    if response.charset:
+        return response.charset
+    return None if b"charset" in page[:4096].lower() else "utf-8"
+
+
+def _parse_html(page: bytes, encoding: str | None) -> lxml_html.HtmlElement:
+    """Parse raw page bytes, decoding them with encoding when it is known."""
+    # Parsers aren't thread-safe, and this runs in the executor; lxml's
+    # default parser is per-thread, so only a custom one needs creating
+    parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+    return lxml_html.fromstring(page, parser=parser)
+
+
+async def _read_capped(response: ClientResponse, cap: int = _MAX_ARTICLE_BYTES) -> bytes:
+    """Read at most cap bytes of a response body."""
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(16384):
+        body += chunk
+        if len(body) >= cap:
+            del body[cap:]
+            break
+    return bytes(body)
+
+
+def _node_text(node: etree._Element) -> str:
+    """Return an element's text with whitespace collapsed.
+
+    Text nodes are joined with spaces so adjacent blocks don't run together.
+    """
+    # str.split() collapses and trims whitespace in one C-level pass
+    return " ".join(" ".join(node.itertext()).split())
+
+
+def _clip_text(text: str, limit: int = _MAX_SUMMARY_CHARS) -> str:
+    """Collapse whitespace and cap text at about limit characters.
+
+    Only a prefix of twice the limit is collapsed first, so a long page body
+    is usually not copied in full just to be cut down afterwards.
+    """
+    window = limit * 2
+    collapsed = " ".join(text[:window].split())
+    if len(collapsed) <= limit and len(text) > window:
+        # Mostly whitespace so far; the rest of the text may still be needed
+        collapsed = " ".join(text.split())
+    if len(collapsed) <= limit:
+        return collapsed
+    # Cut at the last word boundary so the UI never shows half a word
+    return collapsed[:limit].rsplit(" ", 1)[0] + "…"
+
+
+def _dedup_key(link: str, title: str) -> bytes:
+    """Return a compact identity for an article, its link or else its title.
+
+    Google tacks per-request parameters such as oc=5 onto otherwise equal
+    story links, so the query string is left out.
+    """
+    key = link.split("?", 1)[0] if link else title
+    return blake2b(key.encode(), digest_size=16).digest()
+
+
+def _simhash(text: str) -> int:
+    """Return a 64-bit SimHash of the character 3-grams in text.
+
+    Character rather than word shingles, since headlines are too short for
+    word n-grams to survive a one-word edit.
+    """
+    text = " ".join(text.lower().split())
+    votes = [0] * 64
+    for i in range(max(len(text) - 2, 1)):
+        value = int.from_bytes(
+            blake2b(text[i : i + 3].encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(64):
+            votes[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, vote in enumerate(votes) if vote > 0)
+
+
+def _is_near_duplicate(
+    fingerprint: int, seen: dict[tuple[int, int], list[int]]
+) -> bool:
+    """Return True if fingerprint is close to one in seen, otherwise record it.
+
+    Only fingerprints sharing at least one 16-bit band are compared.
+    """
+    bands = [
+        (band, fingerprint >> (band * 16) & 0xFFFF) for band in range(_SIMHASH_BANDS)
+    ]
+    for key in bands:
+        for other in seen.get(key, ()):
+            if (fingerprint ^ other).bit_count() <= _SIMHASH_DISTANCE:
+                return True
+    for key in bands:
+        seen.setdefault(key, []).append(fingerprint)
+    return False
+
+
+def feed_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Return the store holding an entry's news snapshot and caches."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}_feed_cache.{entry_id}")
+
 
 class NewsCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, str]]]]):
     """Coordinator to fetch and parse Google News RSS feeds."""
@@ -23,6 +311,7 @@ class NewsCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, str]]]]):
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: ConfigEntry,
         scan_interval: int,
         max_per_category: int,
         local_geo: str,
@@ -33,6 +322,7 @@ class NewsCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, str]]]]):
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
         )
@@ -40,81 +330,325 @@ class NewsCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, str]]]]):
         self._local_geo = local_geo
         self._enabled_categories = enabled_categories
         self._custom_sources = custom_sources or []
-        self._session = None
-        # Initialize session lazily
-        from homeassistant.helpers import aiohttp_client
-        self._aiohttp_client = aiohttp_client
+        self._session: ClientSession | None = None
+        # Article URL -> (expiry on the monotonic clock, extracted text)
+        self._scrape_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._scrape_inflight: dict[str, asyncio.Task[str]] = {}
+        self._url_cache: dict[str, str] = {}
+        # Per-URL (etag, last_modified, parsed articles) for conditional GETs
+        self._feed_cache: dict[str, tuple[str | None, str | None, list[dict[str, str]]]] = {}
+        # Last good data, so a restart doesn't have to wait on every feed
+        self._store = feed_cache_store(hass, config_entry.entry_id)
+        self._seed_data: dict[str, list[dict[str, str]]] | None = None
+        # Fields of the next delayed store write, taken when the data was fetched
+        self._snapshot_data: dict[str, Any] = {}
+        self._save_pending = False
+        self._fetch_plan: list[tuple[str, Callable[[], Awaitable[list[dict[str, str]]]]]] = []
+        self._disabled_categories: list[str] = []
+        # (data it was built from, per-category summary) for diagnostics
+        self._diagnostics: tuple[dict[str, list[dict[str, str]]], dict[str, Any]] | None = None
+        self._build_fetch_plan()
+
+    def update_options(
+        self,
+        scan_interval: int,
+        max_per_category: int,
+        local_geo: str,
+        enabled_categories: dict[str, bool],
+        custom_sources: list[dict[str, str]] | None,
+    ) -> None:
+        """Apply changed options to the next refresh."""
+        if max_per_category != self._max_per_category:
+            # Cached feeds were parsed with the old item limit
+            self._feed_cache.clear()
+        self._max_per_category = max_per_category
+        if local_geo != self._local_geo:
+            self._url_cache.pop("Local", None)
+        self._local_geo = local_geo
+        self._enabled_categories = enabled_categories
+        self._custom_sources = custom_sources or []
+        self.update_interval = timedelta(seconds=scan_interval)
+        self._build_fetch_plan()
+
+    def _build_fetch_plan(self) -> None:
+        """Pair each feed with its fetcher, once per options change.
+
+        Fetchers are partials so a failed feed can be fetched again.
+        """
+        # Names are interned: they key the results dict kept between updates
+        # and are looked up by every sensor
+        plan: list[tuple[str, Callable[[], Awaitable[list[dict[str, str]]]]]] = [
+            (
+                sys.intern(category),
+                partial(self._fetch_feed, self._build_url(category), category),
+            )
+            for category, enabled in self._enabled_categories.items()
+            if enabled
+        ]
+        # Custom sources are fetched alongside the categories
+        for source in self._custom_sources:
+            name = sys.intern(source.get("name", ""))
+            query = source.get("query", "")
+            plan.append(
+                (
+                    name,
+                    partial(
+                        self._fetch_feed,
+                        self._build_query_url(query),
+                        f"query feed {name} ({query})",
+                    ),
+                )
+            )
+        self._fetch_plan = plan
+        self._disabled_categories = [
+            sys.intern(category)
+            for category, enabled in self._enabled_categories.items()
+            if not enabled
+        ]
+
+    async def _async_setup(self) -> None:
+        """Set up the coordinator once, before the first refresh."""
+        # Own pool rather than HA's shared session, so connections and DNS
+        # lookups to Google and repeat publishers survive across scans
+        self._session = ClientSession(
+            connector=TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                ssl=ssl_util.get_default_context(),
+            ),
+            # Feed requests override these with their own headers and timeout
+            headers=_SCRAPE_HEADERS,
+            timeout=_ARTICLE_TIMEOUT,
+        )
+        if not (stored := await self._store.async_load()):
+            return
+        # Only reuse a recent snapshot built for the same feeds and limits;
+        # after an options reload it would lack new sources
+        age = dt_util.utcnow().timestamp() - stored.get("saved_at", 0)
+        if (
+            age < self.update_interval.total_seconds()
+            and stored.get("fingerprint") == self._plan_fingerprint()
+        ):
+            self._seed_data = stored.get("data")
+        self._restore_caches(stored)
+
+    async def async_shutdown(self) -> None:
+        """Cancel updates and scrapes, then close the connection pool."""
+        await super().async_shutdown()
+        # Write a pending snapshot now; it would otherwise be lost on unload
+        if self._save_pending:
+            await self._store.async_save(self._snapshot())
+        # Shielded scrapes outlive a cancelled update; stop them before
+        # their session goes away
+        for task in list(self._scrape_inflight.values()):
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def diagnostics_summary(self) -> dict[str, Any]:
+        """Return article counts and titles per category, without full text.
+
+        Built at most once per update, however often diagnostics are downloaded.
+        """
+        data = self.data
+        if self._diagnostics is None or self._diagnostics[0] is not data:
+            self._diagnostics = (
+                data,
+                {
+                    category: {
+                        "count": len(articles),
+                        "articles": [
+                            {"title": art["title"], "summary_length": art["summary_length"]}
+                            for art in articles
+                        ],
+                    }
+                    for category, articles in data.items()
+                },
+            )
+        return dict(self._diagnostics[1])
+
+    def _plan_fingerprint(self) -> dict[str, Any]:
+        """Return what a stored snapshot must match to be served as-is."""
+        return {
+            "feeds": [name for name, _ in self._fetch_plan],
+            "max_per_category": self._max_per_category,
+            "local_geo": self._local_geo,
+        }
+
+    def _dump_caches(self) -> dict[str, Any]:
+        """Return the feed and scrape caches in a JSON-friendly form.
+
+        Scrape expiries move from the monotonic clock to wall-clock time, and
+        only the newest live entries are kept so the file stays small.
+        """
+        now = time.monotonic()
+        offset = time.time() - now
+        scrapes = [
+            (url, expires + offset, text)
+            for url, (expires, text) in self._scrape_cache.items()
+            if expires > now
+        ][-_PERSISTED_SCRAPES:]
+        return {
+            "max_per_category": self._max_per_category,
+            "feeds": {
+                url: [etag, last_modified, articles]
+                for url, (etag, last_modified, articles) in self._feed_cache.items()
+            },
+            "scrapes": scrapes,
+        }
+
+    def _restore_caches(self, stored: dict[str, Any]) -> None:
+        """Load caches saved by _dump_caches."""
+        # Cached feeds were cut to the item limit of the time they were parsed
+        if stored.get("max_per_category") == self._max_per_category:
+            self._feed_cache = {
+                url: (etag, last_modified, articles)
+                for url, (etag, last_modified, articles) in stored.get("feeds", {}).items()
+            }
+        offset = time.monotonic() - time.time()
+        for url, expires, text in stored.get("scrapes", ()):
+            if (expires := expires + offset) > time.monotonic():
+                self._scrape_cache[url] = (expires, text)
+
+    def _async_save_data(self, data: dict[str, list[dict[str, str]]]) -> None:
+        """Schedule a snapshot of data without holding up the update."""
+        self._snapshot_data = {
+            "saved_at": dt_util.utcnow().timestamp(),
+            "fingerprint": self._plan_fingerprint(),
+            "data": data,
+        }
+        self._save_pending = True
+        self._store.async_delay_save(self._snapshot, _SAVE_DELAY)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the pending snapshot for the store to write."""
+        self._save_pending = False
+        return {**self._snapshot_data, **self._dump_caches()}
+
+    @callback
+    def _refresh_after_seed(self, _now: Any) -> None:
+        """Replace the stored snapshot with freshly fetched news."""
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_request_refresh(), name="news-refresh"
+        )
 
     async def _async_update_data(
         self,
     ) -> dict[str, list[dict[str, str]]]:
         """Fetch data from Google News RSS feeds."""
-        if self._session is None:
-            from homeassistant.helpers import aiohttp_client
-            self._session = aiohttp_client.async_get_clientsession(self.hass)
-
-        results: dict[str, list[dict[str, str]]] = {}
-        used_article_ids: set[str] = set()  # Track articles to prevent duplicates
-
-        # Fetch all enabled categories in parallel
-        tasks = []
-        category_list = []
-        for category, enabled in self._enabled_categories.items():
-            if not enabled:
-                results[category] = []
-                continue
-
-            category_list.append(category)
-            if category == "Local":
-                tasks.append(self._fetch_local_feed(category))
-            else:
-                tasks.append(self._fetch_topic_feed(category))
+        if self._seed_data is not None:
+            # First refresh after a restart: serve the stored snapshot
+            data, self._seed_data = self._seed_data, None
+            _LOGGER.debug("Using stored news data from previous run")
+            # Don't leave the snapshot up for a whole scan interval
+            self.config_entry.async_on_unload(
+                async_call_later(self.hass, _SEED_REFRESH_DELAY, self._refresh_after_seed)
+            )
+            return data
 
-        # Fetch custom sources in parallel
-        for source in self._custom_sources:
-            category_list.append(source.get("name", ""))
-            tasks.append(self._fetch_query_feed(source.get("name", ""), source.get("query", "")))
+        results: dict[str, list[dict[str, str]]] = {
+            category: [] for category in self._disabled_categories
+        }
+        used_article_ids: set[bytes] = set()  # Track articles to prevent duplicates
+        mark_used = used_article_ids.add
+        # SimHash fingerprints bucketed by (band, band bits) for near-duplicates
+        seen_fingerprints: dict[tuple[int, int], list[int]] = {}
+        feeds = self._fetch_plan
 
-        fetched_data = await asyncio.gather(*tasks, return_exceptions=True)
+        feed_slots = asyncio.Semaphore(_FEED_CONCURRENCY)
+        scrape_slots = asyncio.Semaphore(_SCRAPE_CONCURRENCY)
+
+        async def fetch(
+            category: str, job: Callable[[], Awaitable[list[dict[str, str]]]]
+        ) -> list[dict[str, str]]:
+            async with feed_slots:
+                try:
+                    return await job()
+                except _TRANSIENT_ERRORS as err:
+                    # Retry once rather than leaving the feed empty until the
+                    # next scan interval
+                    _LOGGER.debug("Retrying %s after transient error: %s", category, err)
+                    return await job()
+
+        def take_unique(
+            data: list[dict[str, str]], unique_articles: list[dict[str, str]]
+        ) -> None:
+            for article in data:
+                if len(unique_articles) >= self._max_per_category:
+                    return
+                title = article["title"]
+                article_id = _dedup_key(article["link"], title)
+                if article_id in used_article_ids:
+                    continue
+                # Catch the same story under a different link before it is scraped
+                if _is_near_duplicate(_simhash(title), seen_fingerprints):
+                    _LOGGER.debug("Skipping near-duplicate article: %s", title)
+                    continue
+                mark_used(article_id)
+                unique_articles.append(article)
+
+        async def scrape(url: str) -> str:
+            # Failures are logged here, as they happen, so the page and
+            # traceback aren't held until the whole update finishes
+            try:
+                async with scrape_slots:
+                    return await self._scrape_article(url)
+            except Exception as err:
+                _LOGGER.warning("Error scraping article %s: %s, using description as fallback", url, err)
+                return ""
+
+        # Scrape article content for all articles in parallel. Always try to
+        # scrape - this is the primary method - unless an earlier update
+        # already did and the text is still cached
+        article_list: list[dict[str, str]] = []
+        scraped_results: list[str | asyncio.Task[str]] = []
+        async with asyncio.TaskGroup() as tasks:
+            feed_tasks = [
+                tasks.create_task(_settle(fetch(category, job))) for category, job in feeds
+            ]
+            # Feeds are handled in category order so de-duplication keeps its
+            # priority, but each feed's scrapes start while later feeds load
+            for (category, job), feed_task in zip(feeds, feed_tasks):
+                data = await feed_task
+                if isinstance(data, Exception):
+                    _LOGGER.warning(
+                        "Error fetching %s: %s", category, data, exc_info=data
+                    )
+                    results[category] = []
+                    continue
 
-        for category, data in zip(category_list, fetched_data):
-            if isinstance(data, Exception):
-                _LOGGER.warning(
-                    "Error fetching %s: %s", category, data, exc_info=data
-                )
-                results[category] = []
-            else:
                 # Filter out duplicates and limit to max_per_category
-                unique_articles = []
-                for article in data:
-                    article_id = article.get("link", article.get("title", ""))
-                    if article_id and article_id not in used_article_ids:
-                        used_article_ids.add(article_id)
-                        unique_articles.append(article)
-                        if len(unique_articles) >= self._max_per_category:
-                            break
+                unique_articles: list[dict[str, str]] = []
+                take_unique(data, unique_articles)
+                if (
+                    len(unique_articles) < self._max_per_category
+                    and len(data) == self._max_per_category + _PARSE_HEADROOM
+                ):
+                    # A full-length list means the parse cap may have cut
+                    # items de-duplication would have kept; parse everything
+                    full = await _settle(fetch(category, partial(job, full=True)))
+                    if isinstance(full, Exception):
+                        _LOGGER.debug("Full refetch of %s failed: %s", category, full)
+                    else:
+                        take_unique(full, unique_articles)
                 results[category] = unique_articles
 
-        # Scrape article content for all articles in parallel
-        scrape_tasks = []
-        article_list = []
-        for category, articles in results.items():
-            for article in articles:
-                article_list.append((category, article))
-                # Always try to scrape - this is the primary method
-                scrape_tasks.append(self._scrape_article(article.get("link", "")))
-        
-        # Scrape all articles in parallel
-        scraped_results = await asyncio.gather(*scrape_tasks, return_exceptions=True)
-        
+                for article in unique_articles:
+                    article_list.append(article)
+                    if (cached := self._cached_scrape(article["link"])) is None:
+                        cached = tasks.create_task(scrape(article["link"]))
+                    scraped_results.append(cached)
+
         # Update articles with scraped content
-        for (category, article), scraped in zip(article_list, scraped_results):
-            description = article.get("description", "")
+        for article, scraped in zip(article_list, scraped_results):
+            if isinstance(scraped, asyncio.Task):
+                scraped = scraped.result()
+            description = article["description"]
             
-            if isinstance(scraped, Exception):
-                _LOGGER.warning("Error scraping article: %s, using description as fallback", scraped)
-                article["summary"] = description if description else ""
-            elif scraped and len(scraped) > 100:
+            if scraped and len(scraped) > 100:
                 # Use scraped content if it's substantial
                 article["summary"] = scraped
                 _LOGGER.debug("Using scraped content (%d chars) for article", len(scraped))
@@ -126,374 +660,417 @@ class NewsCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, str]]]]):
                 else:
                     _LOGGER.warning("No description or scraped content available for article")
 
+            # Recorded once here so diagnostics never has to touch the full text
+            article["summary_length"] = len(article["summary"])
+
+        # An all-empty update (e.g. offline) must not replace a good snapshot
+        if any(results.values()):
+            self._async_save_data(results)
         return results
 
-    async def _fetch_topic_feed(
-        self, category: str
+    async def _fetch_feed(
+        self, url: str, label: str, *, full: bool = False
     ) -> list[dict[str, str]]:
-        """Fetch a topic-based RSS feed."""
-        topic = CATEGORY_MAP[category]
-        url = (
-            f"{GOOGLE_RSS_BASE}/topic/{topic}"
-            "?hl=en-US&gl=US&ceid=US:en"
-        )
+        """Fetch and parse a feed, reusing the parsed articles on a 304.
 
+        With full set the feed is fetched unconditionally and every item is
+        parsed, for when the capped parse left a category short.
+        """
+        headers = _FEED_HEADERS if full else self._conditional_headers(url)
         try:
-            async with self._session.get(url, timeout=10) as response:
-                response.raise_for_status()
-                text = await response.text()
-                return self._parse_rss(text)
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch %s: %s", category, err)
+            async with self._session.get(url, timeout=10, headers=headers) as response:
+                if response.status == 304 and url in self._feed_cache:
+                    _LOGGER.debug("%s not modified, reusing parsed articles", label)
+                    return self._copy_feed(url)
+                if response.status != 200:
+                    # Checked rather than raised; Google answers bursts with 429/503
+                    _LOGGER.warning("Failed to fetch %s: HTTP %d", label, response.status)
+                    return []
+                # Raw bytes: lxml honours the XML encoding declaration itself
+                body = await response.read()
+                max_items = (
+                    sys.maxsize if full else self._max_per_category + _PARSE_HEADROOM
+                )
+                articles = await self.hass.async_add_executor_job(
+                    self._parse_rss, body, max_items
+                )
+                self._store_feed(url, response.headers, articles)
+                return self._copy_feed(url) if url in self._feed_cache else articles
+        except _TRANSIENT_ERRORS:
+            # Propagated so _async_update_data can retry just this feed
+            raise
+        except ClientError as err:
+            _LOGGER.warning("Failed to fetch %s: %s", label, err)
             return []
 
-    async def _fetch_local_feed(
-        self, category: str
-    ) -> list[dict[str, str]]:
-        """Fetch a local/geo-based RSS feed."""
-        # URL encode the geo location
-        geo_encoded = quote(self._local_geo)
-        url = (
-            f"{GOOGLE_RSS_BASE}/geo/{geo_encoded}"
-            "?hl=en-US&gl=US&ceid=US:en"
-        )
+    def _build_url(self, category: str) -> str:
+        """Return the RSS URL for a built-in category, building it on first use.
 
-        try:
-            async with self._session.get(url, timeout=10) as response:
-                response.raise_for_status()
-                text = await response.text()
-                return self._parse_rss(text)
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch %s: %s", category, err)
-            return []
+        Entries only go stale when local_geo changes; the options listener
+        drops the Local URL in that case.
+        """
+        if (url := self._url_cache.get(category)) is None:
+            if category == "Local":
+                # URL encode the geo location
+                url = (
+                    f"{GOOGLE_RSS_BASE}/geo/{quote(self._local_geo)}"
+                    "?hl=en-US&gl=US&ceid=US:en"
+                )
+            else:
+                url = (
+                    f"{GOOGLE_RSS_BASE}/topic/{CATEGORY_MAP[category]}"
+                    "?hl=en-US&gl=US&ceid=US:en"
+                )
+            self._url_cache[category] = url
+        return url
 
-    async def _fetch_query_feed(
-        self, name: str, query: str
-    ) -> list[dict[str, str]]:
-        """Fetch a query-based RSS feed."""
-        # URL encode the query
-        query_encoded = quote(query)
-        url = (
-            f"{GOOGLE_RSS_SEARCH_BASE}?q={query_encoded}"
-            "&hl=en-US&gl=US&ceid=US:en"
-        )
+    def _build_query_url(self, query: str) -> str:
+        """Return the search RSS URL for a custom source query.
 
-        try:
-            async with self._session.get(url, timeout=10) as response:
-                response.raise_for_status()
-                text = await response.text()
-                return self._parse_rss(text)
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch query feed %s (%s): %s", name, query, err)
-            return []
+        Custom sources only change through a reload, so these never go stale.
+        """
+        key = f"query:{query}"
+        if (url := self._url_cache.get(key)) is None:
+            url = self._url_cache[key] = (
+                f"{GOOGLE_RSS_SEARCH_BASE}?q={quote(query)}"
+                "&hl=en-US&gl=US&ceid=US:en"
+            )
+        return url
+
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        """Return request headers for a feed, with validators when it is cached."""
+        if (cached := self._feed_cache.get(url)) is None:
+            # Shared and never mutated, so there is nothing to copy
+            return _FEED_HEADERS
+        headers = dict(_FEED_HEADERS)
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _store_feed(
+        self, url: str, headers: Mapping[str, str], articles: list[dict[str, str]]
+    ) -> None:
+        """Remember a feed's validators and parsed articles for the next fetch."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self._feed_cache[url] = (etag, last_modified, articles)
+        else:
+            self._feed_cache.pop(url, None)
+
+    def _copy_feed(self, url: str) -> list[dict[str, str]]:
+        """Return copies of a cached feed's articles.
+
+        Articles are annotated in place during an update, so the cached
+        originals are never handed out directly.
+        """
+        return [dict(article) for article in self._feed_cache[url][2]]
 
-    def _parse_rss(self, xml_text: str) -> list[dict[str, str]]:
-        """Parse RSS XML and extract articles."""
+    def _parse_rss(self, xml_bytes: bytes, max_items: int) -> list[dict[str, str]]:
+        """Parse RSS XML and extract up to max_items articles.
+
+        Runs in the executor; it must not touch hass or the event loop.
+        """
         articles = []
+        unescape = html.unescape
+        # Google often lists one story several times; drop repeats here so
+        # they never reach the update loop
+        seen: set[bytes] = set()
+        seen_add = seen.add
         try:
-            root = ET.fromstring(xml_text)
-            # Find all items
-            for item in root.findall(".//item"):
-                title_elem = item.find("title")
-                link_elem = item.find("link")
-                desc_elem = item.find("description")
-
-                title = ""
-                if title_elem is not None and title_elem.text:
-                    title = html.unescape(title_elem.text.strip())
+            # Stream items so only one <item> subtree is alive at a time
+            for _event, item in etree.iterparse(
+                BytesIO(xml_bytes),
+                events=("end",),
+                tag="item",
+                recover=True,
+                resolve_entities=False,
+                huge_tree=False,
+            ):
+                title = (item.findtext("title") or "").strip()
+                if title:
+                    # The XML parser already decoded one level of entities; only
+                    # double-escaped titles still contain "&"
+                    if "&" in title:
+                        title = unescape(title)
                     # Remove source attribution from title (e.g., " - The Wall Street Journal")
                     # Common patterns: " - Source Name", " | Source Name", " – Source Name" (en dash)
-                    title = re.sub(r'\s*[-|–—]\s*[^-|–—]+$', '', title).strip()
+                    title = _TITLE_SOURCE_RE.sub("", title).strip()
 
-                link = ""
-                if link_elem is not None and link_elem.text:
-                    link = html.unescape(link_elem.text.strip())
+                link = (item.findtext("link") or "").strip()
 
                 # Extract description as fallback
                 description = ""
-                description_html = ""
-                if desc_elem is not None and desc_elem.text:
-                    description_html = desc_elem.text.strip()
-                    
-                    # Extract article link from description HTML FIRST (before processing)
-                    # All links are Google News redirects, but description may have a different/better redirect URL
-                    # Look for <a href="..." in the description
-                    href_match = re.search(r'<a[^>]*href=["\']([^"\']+)["\']', description_html, re.IGNORECASE)
-                    if href_match:
-                        extracted_link = html.unescape(href_match.group(1))
-                        # Use the link from description if available (both are Google redirects anyway)
-                        # The description link might be more direct or newer
-                        if extracted_link:
-                            link = extracted_link
+                description_html = (item.findtext("description") or "").strip()
+                if description_html:
+                    try:
+                        fragment = lxml_html.fragment_fromstring(
+                            description_html, create_parent="div"
+                        )
+                    except etree.ParserError:
+                        fragment = None
+
+                    if fragment is not None:
+                        # All links are Google News redirects, but the description may carry a
+                        # different/newer redirect URL; lxml has already decoded its entities
+                        hrefs = fragment.xpath(".//a/@href")
+                        if hrefs and hrefs[0]:
+                            link = hrefs[0]
                             _LOGGER.debug("Using article URL from description: %s", link)
-                    
-                    # Now extract text content from description
-                    # First unescape HTML entities
-                    description = html.unescape(description_html)
-                    # Remove HTML tags but preserve text content
-                    # Replace <br>, <p>, </p> with spaces first
-                    description = re.sub(r'<br[^>]*>', ' ', description, flags=re.IGNORECASE)
-                    description = re.sub(r'</?p[^>]*>', ' ', description, flags=re.IGNORECASE)
-                    # Remove all other HTML tags
-                    description = re.sub(r'<[^>]+>', ' ', description)
-                    # Clean up whitespace
-                    description = re.sub(r'\s+', ' ', description).strip()
 
-                if title:
+                        # Join text nodes with spaces so adjacent elements don't run together
+                        description = _node_text(fragment)
+
+                # Same key as the update loop
+                if title and (key := _dedup_key(link, title)) not in seen:
+                    seen_add(key)
                     articles.append({"title": title, "link": link, "summary": "", "description": description})
 
-        except ET.ParseError as err:
+                # Free the parsed item and any siblings already handled
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+
+                # Everything past the limit would be dropped by the caller anyway
+                if len(articles) >= max_items:
+                    break
+
+        except etree.XMLSyntaxError as err:
             _LOGGER.warning("Failed to parse RSS XML: %s", err)
         except Exception as err:
             _LOGGER.warning("Unexpected error parsing RSS: %s", err)
 
         return articles
 
-    async def _scrape_article(self, url: str) -> str:
-        """Scrape full article content from URL using readability-lxml."""
+    def _cached_scrape(self, url: str) -> str | None:
+        """Return cached article text for url, or None if it must be scraped."""
         if not url:
             return ""
-        
-        # Initialize session if needed
-        if self._session is None:
-            self._session = self._aiohttp_client.async_get_clientsession(self.hass)
-        
+        if (cached := self._scrape_cache.get(url)) is not None:
+            expires, text = cached
+            if expires > time.monotonic():
+                self._scrape_cache.move_to_end(url)
+                return text
+            del self._scrape_cache[url]
+        return None
+
+    async def _scrape_article(self, url: str) -> str:
+        """Return article text for url, scraping it unless recently cached."""
+        if (cached := self._cached_scrape(url)) is not None:
+            return cached
+
+        # Callers asking for an article that is already being scraped share
+        # that scrape; shielded so one caller giving up doesn't cancel it
+        if (task := self._scrape_inflight.get(url)) is None:
+            task = self._scrape_inflight[url] = self.hass.async_create_task(
+                self._scrape_and_cache(url), name="news-scrape"
+            )
+            task.add_done_callback(partial(self._scrape_inflight.pop, url))
+        return await asyncio.shield(task)
+
+    async def _scrape_and_cache(self, url: str) -> str:
+        """Scrape url within the deadline and cache the result."""
+        now = time.monotonic()
+        try:
+            async with asyncio.timeout(_SCRAPE_DEADLINE):
+                text = await self._fetch_article_text(url)
+        except TimeoutError:
+            _LOGGER.debug("Scraping %s took over %ds, using RSS description", url, _SCRAPE_DEADLINE)
+            text = ""
+        ttl = _SCRAPE_CACHE_TTL if text else _SCRAPE_CACHE_NEGATIVE_TTL
+        self._scrape_cache[url] = (now + ttl, text)
+        if len(self._scrape_cache) > _SCRAPE_CACHE_SIZE:
+            # Least recently used first
+            self._scrape_cache.popitem(last=False)
+        return text
+
+    async def _fetch_article_text(self, url: str) -> str:
+        """Scrape full article content from URL using readability-lxml."""
         try:
             # For Google News redirect URLs, we need to extract the actual article URL
             actual_url = url
+            # Set when the redirect lands on the article, saving a second request
+            page: bytes | None = None
+            encoding: str | None = None
             if "news.google.com/rss/articles" in url:
                 # This is a Google News redirect URL, follow it to get the actual URL
                 try:
                     # First, try to follow redirects automatically
                     async with self._session.get(
                         url,
-                        timeout=15,
+                        timeout=_REDIRECT_TIMEOUT,
                         allow_redirects=True,
                         max_redirects=10,
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                            "Accept-Language": "en-US,en;q=0.5",
-                            "Referer": "https://news.google.com/",
-                        }
                     ) as redirect_response:
                         if redirect_response.status == 200:
                             # Get the final URL after redirects
                             final_url = str(redirect_response.url)
                             if final_url != url and "news.google.com" not in final_url:
+                                if _is_unscrapable(final_url) or not _is_article_response(redirect_response):
+                                    _LOGGER.debug("Not scraping %s, using RSS description", final_url)
+                                    return ""
                                 actual_url = final_url
-                                _LOGGER.debug("Extracted actual URL from redirect: %s", actual_url)
+                                page = await _read_capped(redirect_response)
+                                encoding = _page_encoding(redirect_response, page)
+                                _LOGGER.debug("Fetched article via redirect: %s", actual_url)
                             else:
                                 # Still on Google News, try to extract from HTML
-                                redirect_html = await redirect_response.text()
+                                redirect_html = (await _read_capped(redirect_response)).decode(
+                                    redirect_response.charset or "utf-8", errors="replace"
+                                )
                                 
-                                # Try multiple methods to extract the actual URL
-                                # Method 1: Look for meta refresh
-                                meta_refresh = re.search(r'<meta[^>]*http-equiv=["\']?refresh["\']?[^>]*content=["\']?[^"\']*url=([^"\']+)["\']?', redirect_html, re.IGNORECASE)
-                                if meta_refresh:
-                                    actual_url = meta_refresh.group(1)
-                                    _LOGGER.debug("Extracted actual URL from meta refresh: %s", actual_url)
-                                else:
-                                    # Method 2: Look for JavaScript redirect
-                                    js_redirect = re.search(r'window\.location\.href\s*=\s*["\']([^"\']+)["\']', redirect_html, re.IGNORECASE)
-                                    if js_redirect:
-                                        actual_url = js_redirect.group(1)
-                                        _LOGGER.debug("Extracted actual URL from JavaScript redirect: %s", actual_url)
-                                    else:
-                                        # Method 3: Look for article link in the page
-                                        article_link = re.search(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>.*?Read more', redirect_html, re.IGNORECASE | re.DOTALL)
-                                        if article_link:
-                                            actual_url = article_link.group(1)
-                                            _LOGGER.debug("Extracted actual URL from article link: %s", actual_url)
-                                        else:
-                                            # Method 4: Look for any external link (not Google News)
-                                            external_links = re.findall(r'<a[^>]*href=["\'](https?://[^"\']+)["\']', redirect_html, re.IGNORECASE)
-                                            for link in external_links:
-                                                if "news.google.com" not in link and "google.com" not in link:
-                                                    actual_url = link
-                                                    _LOGGER.debug("Extracted actual URL from external link: %s", actual_url)
-                                                    break
+                                if target := _find_redirect_target(redirect_html):
+                                    actual_url = target
+                                    _LOGGER.debug("Extracted actual URL from Google News page: %s", actual_url)
                 except Exception as redirect_err:
                     _LOGGER.debug("Could not extract URL from redirect: %s", redirect_err)
             
-            # Fetch the actual article URL
-            async with self._session.get(
-                actual_url, 
-                timeout=25, 
-                allow_redirects=True,
-                max_redirects=10,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Referer": "https://news.google.com/",
-                }
-            ) as response:
-                if response.status != 200:
-                    _LOGGER.debug("Failed to fetch article from %s: HTTP %d", actual_url, response.status)
+            # Otherwise fetch the article URL (resolved from the interstitial, if any)
+            if page is None:
+                if actual_url == url and "news.google.com/rss/articles" in url:
+                    # The Google link already failed or gave no target; asking
+                    # again would only repeat the same round trip
+                    _LOGGER.debug("Could not resolve %s, using RSS description", url)
                     return ""
+                if _is_unscrapable(actual_url):
+                    _LOGGER.debug("Not scraping %s, using RSS description", actual_url)
+                    return ""
+                async with self._session.get(
+                    actual_url,
+                    allow_redirects=True,
+                    max_redirects=10,
+                ) as response:
+                    if response.status != 200:
+                        _LOGGER.debug("Failed to fetch article from %s: HTTP %d", actual_url, response.status)
+                        return ""
+                    if not _is_article_response(response):
+                        _LOGGER.debug(
+                            "Not scraping %s (%s, %s bytes), using RSS description",
+                            actual_url,
+                            response.content_type,
+                            response.content_length,
+                        )
+                        return ""
                 
-                html_content = await response.text()
-                final_url = str(response.url)
-                _LOGGER.debug("Fetched article from %s (final URL: %s)", actual_url, final_url)
-                
-                # Use readability-lxml to extract article content
-                try:
-                    from readability import Document
-                    from lxml import html as lxml_html
-                    
-                    # Parse HTML with lxml
-                    doc = lxml_html.fromstring(html_content.encode('utf-8'))
-                    
-                    # Use readability to extract article content
-                    readable_article = Document(doc)
-                    article_html = readable_article.summary()
-                    
-                    # Parse the extracted HTML to get text
-                    article_doc = lxml_html.fromstring(article_html.encode('utf-8'))
-                    article_text = article_doc.text_content()
-                    
-                    # Clean up the text
-                    # Decode HTML entities
-                    article_text = html.unescape(article_text)
-                    # Collapse whitespace
-                    article_text = re.sub(r'\s+', ' ', article_text)
-                    article_text = article_text.strip()
-                    
-                    # Limit to reasonable length (5000 chars for full articles)
-                    if len(article_text) > 5000:
-                        article_text = article_text[:5000] + "..."
-                    
-                    if article_text and len(article_text) > 100:
-                        _LOGGER.debug("Successfully scraped article from %s (%d chars)", url, len(article_text))
-                        return article_text
-                    else:
-                        _LOGGER.debug("Readability extracted insufficient content from %s (%d chars), trying fallback", url, len(article_text) if article_text else 0)
-                        # Fallback to basic extraction if readability didn't work well
-                        result = self._basic_extract_article(html_content)
-                        if result and len(result) > 100:
-                            return result
-                        return article_text if article_text else ""
-                        
-                except ImportError:
-                    _LOGGER.debug("readability-lxml not available, falling back to basic extraction for %s", url)
-                    # Fallback to basic extraction if readability is not available
-                    result = self._basic_extract_article(html_content)
-                    if not result:
-                        _LOGGER.debug("Both readability and basic extraction failed for %s, will use RSS description", url)
-                    return result
-                except Exception as err:
-                    _LOGGER.debug("Readability extraction failed for %s: %s, trying fallback", url, err)
-                    # Fallback to basic extraction
-                    result = self._basic_extract_article(html_content)
-                    if not result:
-                        _LOGGER.debug("Both readability and basic extraction failed for %s: %s, will use RSS description", url, err)
-                    return result
-                
+                    page = await _read_capped(response)
+                    encoding = _page_encoding(response, page)
+                    _LOGGER.debug("Fetched article from %s (final URL: %s)", actual_url, response.url)
+
+            # Readability and lxml are CPU-bound; keep them off the event loop
+            return await self.hass.async_add_executor_job(
+                self._extract_article, page, encoding, url
+            )
         except Exception as err:
             _LOGGER.warning("Failed to scrape article from %s: %s", url, err)
             return ""
-    
-    def _basic_extract_article(self, html_content: str) -> str:
-        """Basic fallback article extraction."""
+
+    def _extract_article(self, page: bytes, encoding: str | None, url: str) -> str:
+        """Extract article text with readability, falling back to basic extraction.
+
+        Runs in the executor; it must not touch hass or the event loop.
+        """
         try:
-            # Remove script and style tags
-            html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            html_content = re.sub(r'<noscript[^>]*>.*?</noscript>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            
-            # Try to extract from common article tags (more patterns)
-            article_patterns = [
-                r'<article[^>]*>(.*?)</article>',
-                r'<div[^>]*class="[^"]*article[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*post[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*entry[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*id="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*id="[^"]*article[^"]*"[^>]*>(.*?)</div>',
-                r'<main[^>]*>(.*?)</main>',
-                r'<section[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</section>',
-            ]
-            
-            content = ""
-            for pattern in article_patterns:
-                matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
-                if matches:
-                    # Get the longest match (likely the main content)
-                    content = max(matches, key=len)
-                    if len(content) > 200:  # Only use if substantial content
-                        break
-            
-            if not content or len(content) < 200:
-                # Try to extract paragraphs directly - this is often the most reliable
-                para_matches = re.findall(r'<p[^>]*>(.*?)</p>', html_content, re.DOTALL | re.IGNORECASE)
-                if para_matches:
-                    # Combine all paragraphs
-                    para_texts = []
-                    for para in para_matches:
-                        # Strip HTML from paragraph
-                        para_clean = re.sub(r'<[^>]+>', ' ', para)
-                        para_clean = html.unescape(para_clean)
-                        para_clean = re.sub(r'\s+', ' ', para_clean).strip()
-                        # Only include substantial paragraphs (at least 30 chars to avoid navigation/ads)
-                        if len(para_clean) > 30:
-                            para_texts.append(para_clean)
-                    if para_texts:
-                        # Join paragraphs and filter out very short ones
-                        combined = ' '.join(para_texts)
-                        if len(combined) > 200:
-                            content = combined
-                            _LOGGER.debug("Extracted content from paragraphs (%d chars)", len(content))
-            
-            if not content or len(content) < 200:
-                # Fallback: extract from body, but exclude common non-content elements
-                body_match = re.search(r'<body[^>]*>(.*?)</body>', html_content, re.DOTALL | re.IGNORECASE)
-                if body_match:
-                    body_content = body_match.group(1)
-                    # Remove navigation, header, footer, sidebar, ads, scripts, forms
-                    body_content = re.sub(r'<nav[^>]*>.*?</nav>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<header[^>]*>.*?</header>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<footer[^>]*>.*?</footer>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<aside[^>]*>.*?</aside>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<div[^>]*class="[^"]*ad[^"]*"[^>]*>.*?</div>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<div[^>]*id="[^"]*ad[^"]*"[^>]*>.*?</div>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<form[^>]*>.*?</form>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    body_content = re.sub(r'<button[^>]*>.*?</button>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-                    # Extract text from remaining body
-                    body_content = re.sub(r'<[^>]+>', ' ', body_content)
-                    body_content = html.unescape(body_content)
-                    body_content = re.sub(r'\s+', ' ', body_content).strip()
-                    if len(body_content) > 200:
-                        content = body_content
-                        _LOGGER.debug("Extracted content from body (%d chars)", len(content))
-            
-            # Strip HTML tags but preserve paragraph breaks
-            content = re.sub(r'</p>', '\n\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'</div>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<br[^>]*>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<[^>]+>', ' ', content)
-            
-            # Decode HTML entities
-            content = html.unescape(content)
-            
-            # Clean up whitespace
-            content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)  # Max 2 consecutive newlines
-            content = re.sub(r'[ \t]+', ' ', content)  # Collapse spaces
-            content = content.strip()
+            # Parse HTML with lxml
+            doc = _parse_html(page, encoding)
+            # Readability discards page chrome anyway; dropping it up front
+            # keeps it out of the quick <article>/<main> check as well
+            etree.strip_elements(doc, *_NON_CONTENT_TAGS, with_tail=False)
+
+            # Most news sites wrap the story in <article> or <main>; when that
+            # already holds plenty of text, skip readability's node scoring
+            quick_text = max(
+                (_node_text(node) for node in _QUICK_ARTICLE_XPATH(doc)), key=len, default=""
+            )
+            if len(quick_text) >= _QUICK_ARTICLE_MIN_CHARS:
+                quick_text = _clip_text(quick_text)
+                _LOGGER.debug("Extracted article from %s without readability (%d chars)", url, len(quick_text))
+                return quick_text
+
+            if not _HAS_READABILITY:
+                _LOGGER.debug("readability-lxml not available, falling back to basic extraction for %s", url)
+                result = self._basic_extract_article(page, encoding)
+                if not result:
+                    _LOGGER.debug("Both readability and basic extraction failed for %s, will use RSS description", url)
+                return result
+
+            # Use readability to extract article content; it needs the markup
+            # itself, as it parses with its own encoding handling
+            readable_article = Document(
+                page.decode(encoding, errors="replace") if encoding else page
+            )
+            article_html = readable_article.summary()
             
-            # Limit to reasonable length (5000 chars)
-            if len(content) > 5000:
-                content = content[:5000] + "..."
+            # Parse the extracted HTML to get text
+            article_doc = lxml_html.fromstring(article_html)
+            # lxml has already decoded HTML entities; collapse whitespace
+            # and limit to a reasonable length for full articles
+            article_text = _clip_text(article_doc.text_content())
             
-            if content and len(content) > 50:
+            if article_text and len(article_text) > 100:
+                _LOGGER.debug("Successfully scraped article from %s (%d chars)", url, len(article_text))
+                return article_text
+            else:
+                _LOGGER.debug("Readability extracted insufficient content from %s (%d chars), trying fallback", url, len(article_text) if article_text else 0)
+                # Fallback to basic extraction if readability didn't work well
+                result = self._basic_extract_article(page, encoding)
+                if result and len(result) > 100:
+                    return result
+                return article_text if article_text else ""
+                
+        except Exception as err:
+            _LOGGER.debug("Readability extraction failed for %s: %s, trying fallback", url, err)
+            # Fallback to basic extraction
+            result = self._basic_extract_article(page, encoding)
+            if not result:
+                _LOGGER.debug("Both readability and basic extraction failed for %s: %s, will use RSS description", url, err)
+            return result
+    
+    def _basic_extract_article(self, page: bytes, encoding: str | None) -> str:
+        """Basic fallback article extraction."""
+        try:
+            tree = _parse_html(page, encoding)
+        except etree.ParserError as err:
+            _LOGGER.debug("Basic extraction could not parse page: %s", err)
+            return ""
+
+        try:
+            # Drop scripts and page chrome in one pass; their tails are real text
+            etree.strip_elements(tree, *_NON_CONTENT_TAGS, with_tail=False)
+
+            # Try common article containers first, longest text wins
+            content = max(
+                (_node_text(node) for node in _ARTICLE_XPATH(tree)), key=len, default=""
+            )
+
+            if len(content) < 200:
+                # Paragraphs are often the most reliable; short ones are nav/ads
+                paragraphs = [
+                    text for p in tree.iter("p") if len(text := _node_text(p)) > 30
+                ]
+                combined = " ".join(paragraphs)
+                if len(combined) > 200:
+                    content = combined
+                    _LOGGER.debug("Extracted content from paragraphs (%d chars)", len(content))
+
+            if len(content) < 200:
+                # Fallback: whatever text is left in the body
+                body = tree.find(".//body")
+                body_content = _node_text(tree if body is None else body)
+                if len(body_content) > 200:
+                    content = body_content
+                    _LOGGER.debug("Extracted content from body (%d chars)", len(content))
+
+            # Limit to reasonable length
+            content = _clip_text(content)
+
+            if len(content) > 50:
                 _LOGGER.debug("Basic extraction succeeded (%d chars)", len(content))
                 return content
-            else:
-                _LOGGER.debug("Basic extraction produced insufficient content (%d chars), will use RSS description", len(content) if content else 0)
-                return ""
+            _LOGGER.debug("Basic extraction produced insufficient content (%d chars), will use RSS description", len(content))
+            return ""
         except Exception as err:
             _LOGGER.warning("Basic extraction failed: %s", err, exc_info=True)
             return ""
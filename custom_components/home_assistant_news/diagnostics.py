@@ -18,7 +18,6 @@ async def async_get_config_entry_diagnostics(
     if not coordinator:
         return {"error": "Coordinator not found"}
 
-    data = coordinator.data
     options = entry.options
 
     # Build diagnostics without full article text
@@ -43,19 +42,10 @@ async def async_get_config_entry_diagnostics(
             if coordinator.last_exception
             else None,
         },
-        "categories": {},
+        # Category counts and article titles (not full text)
+        "categories": coordinator.diagnostics_summary(),
     }
 
-    # Add category counts and article titles (not full text)
-    for category, articles in data.items():
-        diagnostics["categories"][category] = {
-            "count": len(articles),
-            "articles": [
-                {"title": art["title"], "summary_length": len(art.get("summary", ""))}
-                for art in articles
-            ],
-        }
-
     return diagnostics
 
 
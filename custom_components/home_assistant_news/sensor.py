@@ -3,30 +3,106 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CATEGORY_ORDER, DOMAIN
 from .coordinator import NewsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-CATEGORIES = [
-    "U.S.",
-    "World",
-    "Local",
-    "Business",
-    "Technology",
-    "Entertainment",
-    "Sports",
-    "Science",
-    "Health",
-]
+_SOURCE_WORDS = (
+    "News|Journal|Times|Post|Tribune|Herald|Gazette|Chronicle|Observer|Guardian"
+    "|Independent|Express|Mirror|Sun|Star|Mail|Telegraph|Standard|Review|Magazine"
+    "|Weekly|Daily|Monthly|Today|Now|Here|There|This|That"
+)
+# Trailing source attribution on titles: " - Source", " | Source", " – Source"
+_TITLE_TAIL_RE = re.compile(r"\s*[-|–—]\s*[^-|–—]+$")
+# Punctuation and whitespace left behind once a leading title is cut from the content
+_LEAD_PUNCT = "-:;|–— \t\n\r\f\v\u00a0"
+# Trailing " - Source Name" and then "source.com" on article content
+_SRC_TITLE_RE = re.compile(
+    rf"\s*[-|–—]\s*[A-Z][a-zA-Z\s]+(?:{_SOURCE_WORDS})\s*$", re.IGNORECASE
+)
+_SRC_DOMAIN_RE = re.compile(
+    r"\s+[A-Z][a-zA-Z\s]+(?:\.com|\.org|\.net|\.io|\.co\.uk)\s*$", re.IGNORECASE
+)
+# Either pattern needs one of these in the trailing run it matches
+_SRC_TAIL_MARKERS = ("-", "|", "–", "—", ".")
+# "Source Name Source Name Source Name" repeated after the title
+_SRC_REPEAT_RE = re.compile(
+    rf"\s+([A-Z][a-zA-Z\s]+(?:{_SOURCE_WORDS}))\s+(\1\s*)+", re.IGNORECASE
+)
+
+# Shared by every sensor while there is no data; read-only so it can't be mutated
+_EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({"article_count": 0})
+# Attribute names for up to 10 stories
+_STORY_KEYS = tuple((f"Story {i} Title", f"Story {i} Article") for i in range(1, 11))
+
+
+def _slugify(category: str) -> str:
+    """Return the entity ID friendly form of a category name."""
+    return category.lower().replace(".", "").replace(" ", "_").replace("-", "_")
+
+
+# Built-in categories never change; custom sources are slugged on demand
+_CATEGORY_SLUGS = {category: _slugify(category) for category in CATEGORY_ORDER}
+
+
+def _attribution_tail_start(text: str) -> int:
+    """Return where the trailing run that could hold a source attribution starts.
+
+    The tail patterns only match letters, whitespace, separators and a domain
+    suffix, so nothing before the last other character can be part of it.
+    """
+    i = len(text)
+    while i and ((ch := text[i - 1]).isalpha() or ch.isspace() or ch in "-|–—."):
+        i -= 1
+    return i
+
+
+@lru_cache(maxsize=512)
+def _clean_article(title: str, summary: str) -> tuple[str, str]:
+    """Return the display title and content for an article.
+
+    Cached, as most stories survive several refreshes unchanged.
+    """
+    # Remove source attribution from title if not already done
+    title = _TITLE_TAIL_RE.sub("", title).strip()
+
+    # Only include the article content, not the title
+    article_content = summary.strip()
+
+    # Remove title if it appears at the start of the content (case-insensitive)
+    if title:
+        # Lowercase only the prefix that could match, not the whole article
+        if article_content[: len(title)].lower() == title.lower():
+            # Remove title and any following punctuation like dashes, colons,
+            # etc.; the end is already stripped
+            article_content = article_content[len(title):].lstrip(_LEAD_PUNCT)
+
+    # Remove source attributions from article content (common patterns)
+    # Remove patterns like "Source Name", "source.com", " - Source Name", etc.
+    # Only the trailing run is searched, and only if it has a separator or dot
+    start = _attribution_tail_start(article_content)
+    tail = article_content[start:]
+    if any(marker in tail for marker in _SRC_TAIL_MARKERS):
+        tail = _SRC_DOMAIN_RE.sub("", _SRC_TITLE_RE.sub("", tail))
+        article_content = article_content[:start] + tail
+
+    # Remove repeated source names that appear in the content
+    # Common pattern: "Title Source Name Source Name Source Name..."
+    article_content = _SRC_REPEAT_RE.sub(r" \1", article_content)
+
+    return title, article_content
 
 
 async def async_setup_entry(
@@ -38,27 +114,18 @@ async def async_setup_entry(
     coordinator: NewsCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create a sensor for each category
-    sensors = []
-    for category in CATEGORIES:
-        sensors.append(
-            NewsCategorySensor(
-                coordinator=coordinator,
-                entry=entry,
-                category=category,
-            )
-        )
-    
+    sensors = [
+        NewsCategorySensor(coordinator=coordinator, entry=entry, category=category)
+        for category in CATEGORY_ORDER
+    ]
+
     # Create sensors for custom sources
-    custom_sources = entry.options.get("custom_sources", [])
-    for source in custom_sources:
-        sensors.append(
-            NewsCategorySensor(
-                coordinator=coordinator,
-                entry=entry,
-                category=source.get("name", ""),
-                is_custom=True,
-            )
+    sensors.extend(
+        NewsCategorySensor(
+            coordinator=coordinator, entry=entry, category=source.get("name", "")
         )
+        for source in entry.options.get("custom_sources", [])
+    )
 
     async_add_entities(sensors)
 
@@ -73,18 +140,23 @@ class NewsCategorySensor(
         coordinator: NewsCoordinator,
         entry: ConfigEntry,
         category: str,
-        is_custom: bool = False,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._category = category
-        self._is_custom = is_custom
-        # Create entity ID friendly name
-        category_slug = category.lower().replace('.', '').replace(' ', '_').replace('-', '_')
+        category_slug = _CATEGORY_SLUGS.get(category) or _slugify(category)
         self._attr_name = f"Home Assistant News {category}"
         self._attr_unique_id = f"{entry.entry_id}_{category_slug}"
         self._attr_icon = "mdi:newspaper-variant-multiple"
         self._attr_entity_registry_enabled_default = True
+        # Attributes built from the current coordinator data; None when stale
+        self._attrs: Mapping[str, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached attributes, then write the new state."""
+        self._attrs = None
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int:
@@ -95,49 +167,31 @@ class NewsCategorySensor(
         return len(articles)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return additional state attributes, built once per update."""
+        if self._attrs is None:
+            self._attrs = self._build_attributes()
+        return self._attrs
+
+    def _build_attributes(self) -> Mapping[str, Any]:
+        """Build the article count and story attributes."""
         if not self.coordinator.data:
-            return {
-                "article_count": 0,
-            }
+            return _EMPTY_ATTRS
 
         articles = self.coordinator.data.get(self._category, [])
         attrs: dict[str, Any] = {
             "article_count": len(articles),
         }
         
-        # Format as Story 1 Title, Story 1 Article, etc. (up to 10 stories)
+        # Format as Story 1 Title, Story 1 Article, etc. (up to 10 stories;
+        # zip stops at the shorter of the keys and the articles)
         # Don't include title in article text - just the article content
-        for i, article in enumerate(articles[:10], start=1):
-            title = article.get("title", "")
-            # Remove source attribution from title if not already done
-            title = re.sub(r'\s*[-|–—]\s*[^-|–—]+$', '', title).strip()
-            attrs[f"Story {i} Title"] = title
-            
-            # Only include the article content, not the title
-            article_content = article.get("summary", "").strip()
-            
-            # Remove title if it appears at the start of the content (case-insensitive)
-            if title:
-                title_lower = title.lower()
-                content_lower = article_content.lower()
-                if content_lower.startswith(title_lower):
-                    # Remove title and any following punctuation/whitespace
-                    article_content = article_content[len(title):].strip()
-                    # Remove leading punctuation like dashes, colons, etc.
-                    article_content = re.sub(r'^[-:;|–—\s]+', '', article_content).strip()
-            
-            # Remove source attributions from article content (common patterns)
-            # Remove patterns like "Source Name", "source.com", " - Source Name", etc.
-            article_content = re.sub(r'\s*[-|–—]\s*[A-Z][a-zA-Z\s]+(?:News|Journal|Times|Post|Tribune|Herald|Gazette|Chronicle|Observer|Guardian|Independent|Express|Mirror|Sun|Star|Mail|Telegraph|Standard|Review|Magazine|Weekly|Daily|Monthly|Today|Now|Here|There|This|That)\s*$', '', article_content, flags=re.IGNORECASE)
-            article_content = re.sub(r'\s+[A-Z][a-zA-Z\s]+(?:\.com|\.org|\.net|\.io|\.co\.uk)\s*$', '', article_content, flags=re.IGNORECASE)
-            
-            # Remove repeated source names that appear in the content
-            # Common pattern: "Title Source Name Source Name Source Name..."
-            article_content = re.sub(r'\s+([A-Z][a-zA-Z\s]+(?:News|Journal|Times|Post|Tribune|Herald|Gazette|Chronicle|Observer|Guardian|Independent|Express|Mirror|Sun|Star|Mail|Telegraph|Standard|Review|Magazine|Weekly|Daily|Monthly|Today|Now|Here|There|This|That))\s+(\1\s*)+', r' \1', article_content, flags=re.IGNORECASE)
-            
-            attrs[f"Story {i} Article"] = article_content
+        for (title_key, article_key), article in zip(_STORY_KEYS, articles):
+            title, article_content = _clean_article(
+                article.get("title", ""), article.get("summary", "")
+            )
+            attrs[title_key] = title
+            attrs[article_key] = article_content
         
         return attrs
 
@@ -1,14 +1,53 @@
 """AI summarization module for generating broadcast scripts."""
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
 
 _LOGGER = logging.getLogger(__name__)
 
+_PROMPT_TEMPLATE = """You are an expert broadcast writer. Use ONLY the following JSON of fresh Google News items to write a single spoken news script.
+
+JSON: {payload}
+
+Rules:
+
+- Greet: 'Good {greeting},'
+
+- For each category in order, if it has at least 1 article, say: 'in the world of <Category>,'
+
+  then for each article (max {max_per_category} per category) write one concise paragraph:
+
+  first a 5–12 word title-style summary, then a one-paragraph summary using only the provided text.
+
+- Between articles say exactly: 'Next up,'
+
+- Keep each article summary to one short paragraph. No bullets. No links. No sources.
+
+- Do not invent facts. If a category has no articles, skip it.
+
+- Output plain text only."""
+
+
+def _extract_genai_text(response: Any) -> str:
+    """Return the text from a generate_content response (dict or list of dicts)."""
+    if isinstance(response, list):
+        response = response[0] if response else None
+    if isinstance(response, dict):
+        return (response.get("text") or "").strip()
+    return ""
+
+
+def _extract_conversation_speech(response: Any) -> str:
+    """Return the plain speech from a conversation.process response."""
+    try:
+        return (response["speech"]["plain"]["speech"] or "").strip()
+    except (KeyError, TypeError):
+        return ""
+
 
 async def async_generate_briefing(
     hass: HomeAssistant,
@@ -34,31 +73,14 @@ async def async_generate_briefing(
     Raises:
         RuntimeError: If AI service is unavailable or fails
     """
-    # Build the JSON payload
-    payload = json.dumps(data, indent=2)
-
-    # Compose the prompt
-    prompt = f"""You are an expert broadcast writer. Use ONLY the following JSON of fresh Google News items to write a single spoken news script.
-
-JSON: {payload}
-
-Rules:
-
-- Greet: 'Good {greeting},'
-
-- For each category in order, if it has at least 1 article, say: 'in the world of <Category>,'
+    # Compact orjson output keeps the prompt (and the tokens sent to the model) small
+    payload = json_dumps(data)
 
-  then for each article (max {max_per_category} per category) write one concise paragraph:
-
-  first a 5–12 word title-style summary, then a one-paragraph summary using only the provided text.
-
-- Between articles say exactly: 'Next up,'
-
-- Keep each article summary to one short paragraph. No bullets. No links. No sources.
-
-- Do not invent facts. If a category has no articles, skip it.
-
-- Output plain text only."""
+    prompt = _PROMPT_TEMPLATE.format(
+        payload=payload,
+        greeting=greeting,
+        max_per_category=max_per_category,
+    )
 
     # Try to determine which service to use
     use_google_genai = False
@@ -79,18 +101,8 @@ Rules:
                 blocking=True,
                 return_response=True,
             )
-            # Extract text from response
-            if isinstance(response, dict):
-                text = response.get("text", "")
-                if text:
-                    return text.strip()
-            elif isinstance(response, list) and len(response) > 0:
-                # Handle list response
-                first = response[0]
-                if isinstance(first, dict):
-                    text = first.get("text", "")
-                    if text:
-                        return text.strip()
+            if text := _extract_genai_text(response):
+                return text
             _LOGGER.warning("Unexpected response format from google_generative_ai_conversation")
             raise RuntimeError("Failed to extract text from AI response")
         except Exception as err:
@@ -112,15 +124,8 @@ Rules:
                 blocking=True,
                 return_response=True,
             )
-            # Extract speech from response
-            if isinstance(response, dict):
-                speech = response.get("speech", {})
-                if isinstance(speech, dict):
-                    plain = speech.get("plain", {})
-                    if isinstance(plain, dict):
-                        text = plain.get("speech", "")
-                        if text:
-                            return text.strip()
+            if text := _extract_conversation_speech(response):
+                return text
             _LOGGER.warning("Unexpected response format from conversation.process")
             raise RuntimeError("Failed to extract speech from conversation response")
         except Exception as err: